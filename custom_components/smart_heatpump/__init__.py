@@ -2,30 +2,65 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 from typing import Final, Any
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
-from .const import DOMAIN
+from homeassistant.core import HomeAssistant, ServiceCall
+
+from .const import (
+    DOMAIN,
+    CONF_ACTUATOR_SWITCH,
+    CONF_OUTSIDE_TEMP_SENSOR,
+    CONF_REMOTE_DEVICE,
+    CONF_REMOTE_ENTITY,
+    CONF_ROOM_TEMP_SENSOR,
+    CONF_SCHEDULE_ENTITY,
+    CONF_TEMP_DOWN_COMMAND,
+    CONF_TEMP_UP_COMMAND,
+    CONF_VIRTUAL_SWITCH,
+    CONF_WEATHER_ENTITY,
+)
 from .coordinator import SmartHeatPumpCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: Final[list[Platform]] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.CLIMATE,
-    Platform.SWITCH,
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
-    Platform.NUMBER,
-]
+)
+
+SERVICE_SET_SCHEDULE_ATTRIBUTES: Final[str] = "set_schedule_attributes"
+
+# Sensitive config entry data redacted from diagnostics
+TO_REDACT: Final[frozenset[str]] = frozenset(
+    {
+        CONF_REMOTE_ENTITY,  # Could contain API keys or sensitive device info
+        CONF_REMOTE_DEVICE,  # Could contain device identifiers
+        CONF_ACTUATOR_SWITCH,  # Could contain switch entity IDs with sensitive info
+        CONF_ROOM_TEMP_SENSOR,  # Could contain entity IDs
+        CONF_WEATHER_ENTITY,  # Could contain entity IDs
+        CONF_OUTSIDE_TEMP_SENSOR,  # Could contain entity IDs
+        CONF_SCHEDULE_ENTITY,  # Could contain entity IDs
+    }
+)
+
+
+def _get_platforms(entry: ConfigEntry) -> tuple[Platform, ...]:
+    """Return the platforms needed by a config entry."""
+    platforms = PLATFORMS
+
+    # Optional platforms that would not create any entity are not set up at all
+    if entry.data.get(CONF_VIRTUAL_SWITCH):
+        platforms += (Platform.SWITCH,)
+    if entry.data.get(CONF_TEMP_UP_COMMAND) and entry.data.get(CONF_TEMP_DOWN_COMMAND):
+        platforms += (Platform.NUMBER,)
+
+    return platforms
 
-UPDATE_INTERVAL: Final[timedelta] = timedelta(seconds=30)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Smarter Heat Pump from a config entry."""
@@ -33,29 +68,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, _get_platforms(entry))
+
+    # Start refreshing only once every entity has registered as a listener
+    entry.async_on_unload(coordinator.async_start())
+    entry.async_on_unload(entry.add_update_listener(coordinator.async_config_entry_updated))
+
+    # The service is shared by all config entries, so only register it once
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_SCHEDULE_ATTRIBUTES):
 
-    async def async_set_schedule_attributes(call):
-        """Handle the service call to set the schedule attributes."""
-        entity_id = call.data.get("entity_id")
-        data = call.data.get("data")
-        if entity_id and data:
-            await coordinator.async_set_schedule_attributes(entity_id, data)
+        async def async_set_schedule_attributes(call: ServiceCall) -> None:
+            """Handle the service call to set the schedule attributes."""
+            entity_id = call.data.get("entity_id")
+            data = call.data.get("data")
+            if not entity_id or not data:
+                return
+            # Each coordinator only keeps the attributes of its own schedule entity
+            for entry_coordinator in hass.data[DOMAIN].values():
+                await entry_coordinator.async_set_schedule_attributes(entity_id, data)
 
-    hass.services.async_register(
-        DOMAIN, "set_schedule_attributes", async_set_schedule_attributes
-    )
+        hass.services.async_register(
+            DOMAIN, SERVICE_SET_SCHEDULE_ATTRIBUTES, async_set_schedule_attributes
+        )
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    platforms_to_unload: list[Platform | str] = list(PLATFORMS)
-
-    unload_ok: bool = await hass.config_entries.async_unload_platforms(entry, platforms_to_unload)
+    unload_ok: bool = await hass.config_entries.async_unload_platforms(entry, _get_platforms(entry))
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_SET_SCHEDULE_ATTRIBUTES)
 
     return unload_ok
 
@@ -66,19 +111,8 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     coordinator: SmartHeatPumpCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Get sensitive data to redact
-    to_redact = [
-        "remote_entity",  # Could contain API keys or sensitive device info
-        "remote_device",  # Could contain device identifiers
-        "actuator_switch",  # Could contain switch entity IDs with sensitive info
-        "room_temp_sensor",  # Could contain entity IDs
-        "weather_entity",  # Could contain entity IDs
-        "outside_temp_sensor",  # Could contain entity IDs
-        "schedule_entity",  # Could contain entity IDs
-    ]
-
     diagnostics = {
-        "entry_data": async_redact_data(entry.data, to_redact),
+        "entry_data": async_redact_data(entry.data, TO_REDACT),
         "coordinator_data": {
             "climate_system_on": coordinator.climate_system_on,
             "physical_heat_pump_on": coordinator.physical_heat_pump_on,
@@ -91,7 +125,7 @@ async def async_get_config_entry_diagnostics(
         "runtime_data": coordinator.data if coordinator.data else {},
         "schedule_info": {
             "schedule_entity_configured": entry.data.get("schedule_entity") is not None,
-            "schedule_attributes_count": len(coordinator._schedule_attributes.get(entry.data.get("schedule_entity"), {})),
+            "schedule_attributes_count": len(coordinator._schedule_attributes),
         },
     }
 
@@ -8,12 +8,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import SmartHeatPumpCoordinator
+from .entity import SmartHeatPumpEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,10 +28,10 @@ async def async_setup_entry(
     async_add_entities([SmartHeatPumpStatusBinarySensor(coordinator, config_entry)])
 
 
-class SmartHeatPumpStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class SmartHeatPumpStatusBinarySensor(SmartHeatPumpEntity, BinarySensorEntity):
     """Binary sensor for Smarter Heat Pump status (for graphs)."""
 
-    _attr_has_entity_name = True
+    _unique_id_suffix = "status"
     _attr_name = "Status"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_icon = "mdi:heat-pump"
@@ -42,17 +42,11 @@ class SmartHeatPumpStatusBinarySensor(CoordinatorEntity, BinarySensorEntity):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_status"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Smarter Heat Pump"),
-            "manufacturer": "Smarter Heat Pump Integration",
-            "model": "Smarter Heat Pump",
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the physical heat pump is running."""
-        return self.coordinator.physical_heat_pump_on
\ No newline at end of file
+        super().__init__(coordinator, config_entry)
+        self._attr_is_on = coordinator.physical_heat_pump_on
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache whether the physical heat pump is running."""
+        self._attr_is_on = self.coordinator.physical_heat_pump_on
+        super()._handle_coordinator_update()
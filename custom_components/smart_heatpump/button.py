@@ -5,15 +5,11 @@ import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    DOMAIN,
-    CONF_CLIMATE_ENTITY,
-)
-from .coordinator import SmartHeatPumpCoordinator
+from .const import DOMAIN
+from .entity import SmartHeatPumpEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,41 +24,34 @@ async def async_setup_entry(
     async_add_entities([SmartHeatPumpFixButton(coordinator, config_entry)])
 
 
-class SmartHeatPumpFixButton(CoordinatorEntity, ButtonEntity):
+class SmartHeatPumpFixButton(SmartHeatPumpEntity, ButtonEntity):
     """Fix button for Smarter Heat Pump to sync state."""
 
-    _attr_has_entity_name = True
+    _unique_id_suffix = "fix_button"
     _attr_name = "Fix State"
     _attr_icon = "mdi:sync"
 
-    def __init__(
-        self,
-        coordinator: SmartHeatPumpCoordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the button."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_fix_button"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Smarter Heat Pump"),
-            "manufacturer": "Smarter Heat Pump Integration",
-            "model": "Smarter Heat Pump",
-        }
+    _last_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability changes, the rest of the state is the last press."""
+        available = self.available
+        if available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
 
     async def async_press(self) -> None:
         """Handle the button press to toggle physical heat pump state without sending IR commands."""
         # Toggle the physical heat pump state without sending any IR commands
         # This is used when someone manually changes the heat pump state with a physical remote
-        new_state: bool = not self.coordinator.physical_heat_pump_on
-        self.coordinator.physical_heat_pump_on = new_state
+        coordinator = self.coordinator
+        new_state: bool = not coordinator.physical_heat_pump_on
         # Sync climate system state to match physical pump
-        self.coordinator.climate_system_on = new_state
-
-        _LOGGER.info(
-            "Fix State button pressed - toggled physical heat pump state to: %s (no IR command sent)",
-            "ON" if new_state else "OFF"
-        )
+        coordinator.sync_power_state(new_state)
 
-        await self.coordinator.async_request_refresh()
\ No newline at end of file
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Fix State button pressed - toggled physical heat pump state to: %s (no IR command sent)",
+                "ON" if new_state else "OFF"
+            )
\ No newline at end of file
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -16,9 +17,8 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -29,9 +29,25 @@ from .const import (
     ATTR_HEAT_PUMP_TARGET_TEMP,
 )
 from .coordinator import SmartHeatPumpCoordinator
+from .entity import SmartHeatPumpEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Preset modes and their target temperatures
+_PRESET_TEMPERATURES: MappingProxyType[str, float] = MappingProxyType(
+    {
+        PRESET_HOME: 20.0,      # Comfortable home temperature
+        PRESET_AWAY: 15.0,      # Energy saving when away
+        PRESET_SLEEP: 16.0,     # Cooler for sleeping
+        PRESET_COMFORT: 22.0,   # Extra warm and comfortable
+    }
+)
+
+# Reverse lookup of the (whole degree) preset temperatures
+_PRESET_BY_TEMPERATURE: MappingProxyType[int, str] = MappingProxyType(
+    {round(temp): preset for preset, temp in _PRESET_TEMPERATURES.items()}
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -43,10 +59,10 @@ async def async_setup_entry(
     async_add_entities([SmartHeatPumpClimate(coordinator, config_entry)])
 
 
-class SmartHeatPumpClimate(CoordinatorEntity, ClimateEntity):
+class SmartHeatPumpClimate(SmartHeatPumpEntity, ClimateEntity):
     """Smarter Heat Pump climate entity."""
 
-    _attr_has_entity_name = True
+    _unique_id_suffix = "climate"
     _attr_name = None
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
@@ -56,21 +72,7 @@ class SmartHeatPumpClimate(CoordinatorEntity, ClimateEntity):
         | ClimateEntityFeature.TURN_OFF
         | ClimateEntityFeature.PRESET_MODE
     )
-
-    # Define preset modes and temperatures
-    _preset_modes = [
-        PRESET_HOME,
-        PRESET_AWAY,
-        PRESET_SLEEP,
-        PRESET_COMFORT,
-    ]
-
-    _preset_temperatures = {
-        PRESET_HOME: 20.0,      # Comfortable home temperature
-        PRESET_AWAY: 15.0,      # Energy saving when away
-        PRESET_SLEEP: 16.0,     # Cooler for sleeping
-        PRESET_COMFORT: 22.0,   # Extra warm and comfortable
-    }
+    _attr_preset_modes = list(_PRESET_TEMPERATURES)
 
     def __init__(
         self,
@@ -78,25 +80,31 @@ class SmartHeatPumpClimate(CoordinatorEntity, ClimateEntity):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Smarter Heat Pump"),
-            "manufacturer": "Smarter Heat Pump Integration",
-            "model": "Smarter Heat Pump",
-        }
-
-    @property
-    def min_temp(self) -> float:
-        """Return the minimum temperature."""
-        return self._config_entry.data.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
-
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum temperature."""
-        return self._config_entry.data.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
+        super().__init__(coordinator, config_entry)
+        # Static for the lifetime of the entity
+        self._attr_min_temp = config_entry.data.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
+        self._attr_max_temp = config_entry.data.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
+        # Rebuilt on the first state write after a coordinator update
+        self._attrs_cache: dict[str, Any] | None = None
+        # Everything the last written state was derived from
+        self._last_rendered: tuple[Any, ...] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if something this entity shows has changed."""
+        self._attrs_cache = None
+        coordinator = self.coordinator
+        rendered = (
+            self.available,
+            self.current_temperature,
+            coordinator.climate_system_on,
+            coordinator.physical_heat_pump_on,
+            coordinator.target_temperature,
+            self.extra_state_attributes,
+        )
+        if rendered != self._last_rendered:
+            self._last_rendered = rendered
+            super()._handle_coordinator_update()
 
     @property
     def current_temperature(self) -> float | None:
@@ -120,21 +128,22 @@ class SmartHeatPumpClimate(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_action(self) -> HVACAction:
         """Return the current HVAC action."""
+        coordinator = self.coordinator
         # If climate system is off, report OFF
-        if not self.coordinator.climate_system_on:
+        if not coordinator.climate_system_on:
             return HVACAction.OFF
 
         # Climate is on, check physical heat pump state
-        if self.coordinator.physical_heat_pump_on:
-            return HVACAction.HEATING
-        else:
-            # Climate is on but physical pump is off = idle/waiting
-            return HVACAction.IDLE
+        # (climate on but physical pump off = idle/waiting)
+        return HVACAction.HEATING if coordinator.physical_heat_pump_on else HVACAction.IDLE
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs = {}
+        if self._attrs_cache is not None:
+            return self._attrs_cache
+
+        attrs: dict[str, Any] = {}
 
         # Only show heat_pump_target_temp if temperature control is available
         if self.coordinator.has_temp_control:
@@ -157,6 +166,7 @@ class SmartHeatPumpClimate(CoordinatorEntity, ClimateEntity):
             if self.coordinator.data.get("pending_power_off") is not None:
                 attrs["pending_power_off"] = self.coordinator.data.get("pending_power_off")
 
+        self._attrs_cache = attrs
         return attrs
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -205,24 +215,19 @@ class SmartHeatPumpClimate(CoordinatorEntity, ClimateEntity):
         """Return the current preset mode."""
         # Find the preset that matches the current target temperature
         current_temp = self.coordinator.target_temperature
-        for preset, temp in self._preset_temperatures.items():
-            if abs(current_temp - temp) < 0.5:  # Allow for small differences
-                return preset
+        nearest = round(current_temp)
+        if abs(current_temp - nearest) < 0.5:  # Allow for small differences
+            return _PRESET_BY_TEMPERATURE.get(nearest)
         return None
 
-    @property
-    def preset_modes(self) -> list[str]:
-        """Return available preset modes."""
-        return self._preset_modes
-
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        if preset_mode not in self._preset_modes:
+        preset_temp = _PRESET_TEMPERATURES.get(preset_mode)
+        if preset_temp is None:
             _LOGGER.error("Invalid preset mode: %s", preset_mode)
             return
 
         # Set the target temperature for this preset
-        preset_temp = self._preset_temperatures[preset_mode]
         self.coordinator.target_temperature = preset_temp
 
         _LOGGER.info("Set preset mode %s with temperature %.1f°C", preset_mode, preset_temp)
\ No newline at end of file
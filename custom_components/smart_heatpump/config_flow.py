@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 from homeassistant.const import CONF_NAME
@@ -39,6 +39,7 @@ from .const import (
     CONF_OUTSIDE_TEMP_DIFF,
     CONF_MIN_OUTSIDE_TEMP,
     CONF_SCHEDULE_ENABLED,
+    CONF_SCAN_INTERVAL,
     DEFAULT_MIN_CYCLE_DURATION,
     DEFAULT_HEAT_TOLERANCE,
     DEFAULT_COLD_TOLERANCE,
@@ -48,22 +49,22 @@ from .const import (
     DEFAULT_INITIAL_TARGET_TEMP,
     DEFAULT_MIN_POWER_CONSUMPTION,
     DEFAULT_COP_VALUE,
+    DEFAULT_SCAN_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by the room and outside temperature fields
+_SENSOR_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME, default="Smart Heat Pump"): str,
-        vol.Required(CONF_ROOM_TEMP_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        ),
+        vol.Required(CONF_ROOM_TEMP_SENSOR): _SENSOR_SELECTOR,
         vol.Optional(CONF_WEATHER_ENTITY): selector.EntitySelector(
             selector.EntitySelectorConfig(domain="weather")
         ),
-        vol.Optional(CONF_OUTSIDE_TEMP_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain="sensor")
-        ),
+        vol.Optional(CONF_OUTSIDE_TEMP_SENSOR): _SENSOR_SELECTOR,
         vol.Optional(CONF_CLIMATE_ENTITY): selector.EntitySelector(
             selector.EntitySelectorConfig(domain="climate")
         ),
@@ -90,29 +91,21 @@ STEP_COMMANDS_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Validators shared by fields with the same bounds
+_TOLERANCE = vol.All(vol.Coerce(float), vol.Range(min=0.1, max=5.0))
+_TEMP_LIMIT = vol.All(vol.Coerce(int), vol.Range(min=-20, max=40))
+_SETPOINT = vol.All(vol.Coerce(int), vol.Range(min=10, max=35))
+
 STEP_SETTINGS_DATA_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_MIN_CYCLE_DURATION, default=DEFAULT_MIN_CYCLE_DURATION): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=3600)
         ),
-        vol.Optional(CONF_HEAT_TOLERANCE, default=DEFAULT_HEAT_TOLERANCE): vol.All(
-            vol.Coerce(float), vol.Range(min=0.1, max=5.0)
-        ),
-        vol.Optional(CONF_COLD_TOLERANCE, default=DEFAULT_COLD_TOLERANCE): vol.All(
-            vol.Coerce(float), vol.Range(min=0.1, max=5.0)
-        ),
-        vol.Optional(CONF_MIN_TEMP, default=DEFAULT_MIN_TEMP): vol.All(
-            vol.Coerce(int), vol.Range(min=-20, max=40)
-        ),
-        vol.Optional(CONF_MAX_TEMP, default=DEFAULT_MAX_TEMP): vol.All(
-            vol.Coerce(int), vol.Range(min=-20, max=40)
-        ),
-        vol.Optional(CONF_INITIAL_HEAT_PUMP_TEMP, default=DEFAULT_INITIAL_HEAT_PUMP_TEMP): vol.All(
-            vol.Coerce(int), vol.Range(min=10, max=35)
-        ),
-        vol.Optional(CONF_INITIAL_TARGET_TEMP, default=DEFAULT_INITIAL_TARGET_TEMP): vol.All(
-            vol.Coerce(int), vol.Range(min=10, max=35)
-        ),
+        vol.Optional(CONF_HEAT_TOLERANCE, default=DEFAULT_HEAT_TOLERANCE): _TOLERANCE,
+        vol.Optional(CONF_COLD_TOLERANCE, default=DEFAULT_COLD_TOLERANCE): _TOLERANCE,
+        vol.Optional(CONF_MIN_TEMP, default=DEFAULT_MIN_TEMP): _TEMP_LIMIT,
+        vol.Optional(CONF_MAX_TEMP, default=DEFAULT_MAX_TEMP): _TEMP_LIMIT,
+        vol.Optional(CONF_INITIAL_TARGET_TEMP, default=DEFAULT_INITIAL_TARGET_TEMP): _SETPOINT,
         vol.Optional(CONF_MIN_POWER_CONSUMPTION, default=DEFAULT_MIN_POWER_CONSUMPTION): vol.All(
             vol.Coerce(int), vol.Range(min=100, max=10000)
         ),
@@ -122,15 +115,36 @@ STEP_SETTINGS_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Settings form when temperature commands are configured
+STEP_SETTINGS_TEMP_CONTROL_DATA_SCHEMA = STEP_SETTINGS_DATA_SCHEMA.extend(
+    {
+        vol.Optional(CONF_INITIAL_HEAT_PUMP_TEMP, default=DEFAULT_INITIAL_HEAT_PUMP_TEMP): _SETPOINT,
+    }
+)
+
+OPTIONS_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=30, max=3600)
+        ),
+    }
+)
+
+# Optional entities checked for existence by validate_input when provided
+_OPTIONAL_ENTITIES: Final[tuple[str, ...]] = (
+    CONF_WEATHER_ENTITY,
+    CONF_OUTSIDE_TEMP_SENSOR,
+    CONF_REMOTE_ENTITY,
+    CONF_ACTUATOR_SWITCH,
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, str]:
     """Validate the user input allows us to connect."""
-    # Validate that required entities exist
-    required_entities = [CONF_ROOM_TEMP_SENSOR]
-    for entity_key in required_entities:
-        entity_id: str | None = data.get(entity_key)
-        if entity_id and not hass.states.get(entity_id):
-            raise ValueError(f"Entity {entity_id} not found")
+    # Validate that the required entity exists
+    get_state = hass.states.get
+    if (entity_id := data.get(CONF_ROOM_TEMP_SENSOR)) and not get_state(entity_id):
+        raise ValueError(f"Entity {entity_id} not found")
 
     # Validate that at least one control method is provided (remote or actuator switch)
     remote_entity: str | None = data.get(CONF_REMOTE_ENTITY)
@@ -140,9 +154,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         raise ValueError("missing_control_method")
 
     # Validate optional entities if provided
-    for entity_key in [CONF_WEATHER_ENTITY, CONF_OUTSIDE_TEMP_SENSOR, CONF_REMOTE_ENTITY, CONF_ACTUATOR_SWITCH]:
-        entity_id: str | None = data.get(entity_key)
-        if entity_id and not hass.states.get(entity_id):
+    for entity_key in _OPTIONAL_ENTITIES:
+        if (entity_id := data.get(entity_key)) and not get_state(entity_id):
             raise ValueError(f"Entity {entity_id} not found")
 
     return {"title": str(data[CONF_NAME])}
@@ -157,6 +170,14 @@ class SmartHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._data: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SmartHeatPumpOptionsFlow:
+        """Get the options flow for this handler."""
+        return SmartHeatPumpOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -171,7 +192,7 @@ class SmartHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if not user_input.get(CONF_ACTUATOR_SWITCH):
                     user_input[CONF_VIRTUAL_SWITCH] = user_input.get(CONF_VIRTUAL_SWITCH, True)
 
-                self._data.update(user_input)
+                self._data |= user_input
                 return await self.async_step_commands()
             except ValueError as err:
                 _LOGGER.error("Validation error: %s", err)
@@ -201,7 +222,7 @@ class SmartHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            self._data.update(user_input)
+            self._data |= user_input
             return await self.async_step_settings()
 
         return self.async_show_form(
@@ -215,48 +236,37 @@ class SmartHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the settings configuration step."""
         if user_input is not None:
-            self._data.update(user_input)
+            self._data |= user_input
             return self.async_create_entry(title=self._data[CONF_NAME], data=self._data)
 
-        # Build dynamic schema based on whether temp commands are configured
+        # Pick the schema based on whether temp commands are configured
         has_temp_commands = bool(
             self._data.get(CONF_TEMP_UP_COMMAND) and self._data.get(CONF_TEMP_DOWN_COMMAND)
         )
 
-        settings_schema = {
-            vol.Optional(CONF_MIN_CYCLE_DURATION, default=DEFAULT_MIN_CYCLE_DURATION): vol.All(
-                vol.Coerce(int), vol.Range(min=60, max=3600)
-            ),
-            vol.Optional(CONF_HEAT_TOLERANCE, default=DEFAULT_HEAT_TOLERANCE): vol.All(
-                vol.Coerce(float), vol.Range(min=0.1, max=5.0)
-            ),
-            vol.Optional(CONF_COLD_TOLERANCE, default=DEFAULT_COLD_TOLERANCE): vol.All(
-                vol.Coerce(float), vol.Range(min=0.1, max=5.0)
-            ),
-            vol.Optional(CONF_MIN_TEMP, default=DEFAULT_MIN_TEMP): vol.All(
-                vol.Coerce(int), vol.Range(min=-20, max=40)
-            ),
-            vol.Optional(CONF_MAX_TEMP, default=DEFAULT_MAX_TEMP): vol.All(
-                vol.Coerce(int), vol.Range(min=-20, max=40)
-            ),
-            vol.Optional(CONF_INITIAL_TARGET_TEMP, default=DEFAULT_INITIAL_TARGET_TEMP): vol.All(
-                vol.Coerce(int), vol.Range(min=10, max=35)
-            ),
-            vol.Optional(CONF_MIN_POWER_CONSUMPTION, default=DEFAULT_MIN_POWER_CONSUMPTION): vol.All(
-                vol.Coerce(int), vol.Range(min=100, max=10000)
-            ),
-            vol.Optional(CONF_COP_VALUE, default=DEFAULT_COP_VALUE): vol.All(
-                vol.Coerce(float), vol.Range(min=1.0, max=10.0)
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=(
+                STEP_SETTINGS_TEMP_CONTROL_DATA_SCHEMA
+                if has_temp_commands
+                else STEP_SETTINGS_DATA_SCHEMA
             ),
-        }
+        )
+
 
-        # Only add CONF_INITIAL_HEAT_PUMP_TEMP if temperature commands are configured
-        if has_temp_commands:
-            settings_schema[vol.Optional(CONF_INITIAL_HEAT_PUMP_TEMP, default=DEFAULT_INITIAL_HEAT_PUMP_TEMP)] = vol.All(
-                vol.Coerce(int), vol.Range(min=10, max=35)
-            )
+class SmartHeatPumpOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for Smarter Heat Pump."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
-            step_id="settings",
-            data_schema=vol.Schema(settings_schema),
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_DATA_SCHEMA, self.config_entry.options
+            ),
         )
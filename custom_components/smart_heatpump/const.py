@@ -33,6 +33,9 @@ CONF_COP_VALUE: Final[str] = "cop_value"
 CONF_OUTSIDE_TEMP_DIFF: Final[str] = "outside_temp_diff"
 CONF_MIN_OUTSIDE_TEMP: Final[str] = "min_outside_temp"
 
+# Options
+CONF_SCAN_INTERVAL: Final[str] = "scan_interval"
+
 # Schedule configuration
 CONF_SCHEDULE_ENABLED: Final[str] = "schedule_enabled"
 
@@ -48,6 +51,8 @@ DEFAULT_MIN_POWER_CONSUMPTION: Final[int] = 1200  # 1.2kW in watts
 DEFAULT_COP_VALUE: Final[float] = 3.0
 DEFAULT_OUTSIDE_TEMP_DIFF: Final[int] = 5
 DEFAULT_MIN_OUTSIDE_TEMP: Final[int] = -10
+# Source entities push their changes; polling is only a safety net
+DEFAULT_SCAN_INTERVAL: Final[int] = 300  # 5 minutes
 
 # Schedule defaults
 
@@ -60,7 +65,6 @@ ENTITY_TARGET_TEMP_SENSOR: Final[str] = "target_temp_sensor"
 ENTITY_POWER_SENSOR: Final[str] = "power_sensor"
 ENTITY_STATUS_BINARY_SENSOR: Final[str] = "status_binary_sensor"
 ENTITY_FIX_BUTTON: Final[str] = "fix_button"
-ENTITY_FIX_BUTTON: Final[str] = "fix_button"
 ENTITY_SCHEDULE: Final[str] = "schedule"
 
 # Attributes
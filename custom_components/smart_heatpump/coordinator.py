@@ -1,13 +1,38 @@
 """Data update coordinator for Smarter Heat Pump."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any
-
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Final
+
+from homeassistant.components.climate import (
+    PRESET_AWAY,
+    PRESET_COMFORT,
+    PRESET_HOME,
+    PRESET_SLEEP,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.template import Template
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -28,14 +53,68 @@ from .const import (
     CONF_TEMP_DOWN_COMMAND,
     CONF_INITIAL_HEAT_PUMP_TEMP,
     CONF_INITIAL_TARGET_TEMP,
+    CONF_SCAN_INTERVAL,
     DEFAULT_COP_VALUE,
     DEFAULT_MIN_POWER_CONSUMPTION,
     DEFAULT_INITIAL_HEAT_PUMP_TEMP,
     DEFAULT_INITIAL_TARGET_TEMP,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_MIN_CYCLE_DURATION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum seconds between commands sent to the device
+MIN_COMMAND_INTERVAL: float = 5.0
+
+# Schedule fields reported when no schedule entity is configured or available
+_NO_SCHEDULE_DATA: Final[MappingProxyType[str, Any]] = MappingProxyType(
+    {"schedule_active": False, "schedule_updated": None}
+)
+
+# Target temperatures for presets requested by a schedule slot
+_SCHEDULE_PRESET_TEMPERATURES: Final[MappingProxyType[str, float]] = MappingProxyType(
+    {
+        PRESET_HOME: 21.0,
+        PRESET_AWAY: 16.0,
+        PRESET_SLEEP: 18.0,
+        PRESET_COMFORT: 22.0,
+    }
+)
+
+_UNAVAILABLE_STATES: frozenset[str] = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+# Turn-on sources that record the time the heat pump was turned on
+_TIMED_TURN_ON_SOURCES: frozenset[str] = frozenset(("schedule", "climate", "fix", "manual"))
+
+# Schedule slot keys that describe when the slot runs rather than what it does
+_SCHEDULE_SLOT_TIME_KEYS: frozenset[str] = frozenset(("from", "to", "weekdays"))
+
+# Schedule entity attributes that are not passed through for display
+_SCHEDULE_EXCLUDED_ATTRIBUTES: frozenset[str] = frozenset(("schedule", "friendly_name", "icon"))
+
+# A schedule entry as (from minutes, to minutes, Python weekdays or None for every day, entry)
+_ParsedScheduleEntry = tuple[int, int, frozenset[int] | None, dict[str, Any]]
+
+
+def _safe_float(value: str) -> float | None:
+    """Return the value as a float, or None if it is not a number."""
+    # Empty and unavailable states are the common non-numeric values, so reject them without raising
+    if not value or value in _UNAVAILABLE_STATES:
+        return None
+    # Plain decimal readings are known to parse, so they skip the exception path
+    if value.removeprefix("-").replace(".", "", 1).isdecimal():
+        return float(value)
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _state_temperature(state: State | None) -> float | None:
+    """Return the numeric value of a temperature sensor state, if it has one."""
+    return _safe_float(state.state) if state else None
+
 
 class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Smarter Heat Pump data update coordinator."""
@@ -46,10 +125,40 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=30),
+            # Polling starts once the platforms are set up and Home Assistant has started, see async_start
+            update_interval=None,
+            # Only notify listeners when the refreshed data actually differs
+            always_update=False,
         )
         self.entry = entry
         self.hass = hass
+        # Bound once; every IR command goes through remote.send_command
+        self._async_send_command = partial(hass.services.async_call, "remote", "send_command")
+        self._load_config()
+
+        # Shared by every entity of this config entry
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.data.get("name", "Smarter Heat Pump"),
+            manufacturer="Smarter Heat Pump Integration",
+            model="Smarter Heat Pump",
+        )
+
+        # Source entities read on every refresh
+        self._tracked_entities: tuple[str, ...] = tuple(
+            filter(
+                None,
+                (
+                    self._room_temp_sensor,
+                    self._weather_entity,
+                    self._outside_temp_sensor,
+                    self._schedule_entity,
+                ),
+            )
+        )
+        # Latest State of each source entity, kept current by polls and the state change subscription
+        self._source_states: dict[str, State | None] = {}
+        self._read_source_states()
 
         # Internal state tracking
         self._climate_system_on: bool = False  # Climate entity on/off (system enabled)
@@ -71,58 +180,120 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._last_command_time: datetime | None = None
         self._cycle_start_time: datetime | None = None
+        # Monotonic deadlines derived from the above, so the checks are a single compare
+        self._next_command_mono: float | None = None
+        self._cycle_end_mono: float | None = None
+        # Device commands currently being sent
+        self._commands_in_flight: int = 0
+        # Schedule data last parsed by _parse_schedule, with its parsed entries
+        self._parsed_schedule: tuple[dict[str, Any], tuple[_ParsedScheduleEntry, ...]] | None = None
+        # Attributes set through the service for the configured schedule entity
         self._schedule_attributes: dict[str, Any] = {}
+        # Parsed schedule slot templates keyed by their source, None if invalid
+        self._templates: dict[str, Template | None] = {}
+        # Automatic control inputs that last needed no command, skipped until they change
+        self._idle_control_inputs: tuple[float | None, float, bool] | None = None
         self._pending_power_off: bool = False  # Track if we need to turn off after minimum cycle
+        self._batch_depth: int = 0  # Nesting level of batch_update, which may span awaits
+        self._control_task: asyncio.Task[None] | None = None
+        self._control_requested: bool = False
+        self._batch_changed: bool = False
 
         # Track how the heat pump was last turned on for smart schedule behavior
         self._last_turn_on_time: datetime | None = None
         self._last_turn_on_source: str | None = None  # "schedule", "climate", "fix", "manual"
 
+    def _load_config(self) -> None:
+        """Cache configuration values that are used on every update or command."""
+        data = self.entry.data
+        self._min_power: int = data.get(CONF_MIN_POWER_CONSUMPTION, DEFAULT_MIN_POWER_CONSUMPTION)
+        self._cop: float = data.get(CONF_COP_VALUE, DEFAULT_COP_VALUE)
+        # Last power estimate and the inputs it was computed from
+        self._power_cache: tuple[tuple[Any, ...], float] | None = None
+
+        self._cmd_on: str | None = data.get(CONF_POWER_ON_COMMAND)
+        self._cmd_off: str | None = data.get(CONF_POWER_OFF_COMMAND)
+        self._cmd_up: str | None = data.get(CONF_TEMP_UP_COMMAND)
+        self._cmd_down: str | None = data.get(CONF_TEMP_DOWN_COMMAND)
+        self._remote_entity: str | None = data.get(CONF_REMOTE_ENTITY)
+        self._remote_device: str | None = data.get(CONF_REMOTE_DEVICE)
+        self._schedule_entity: str | None = data.get(CONF_SCHEDULE_ENTITY)
+        self._room_temp_sensor: str | None = data.get(CONF_ROOM_TEMP_SENSOR)
+        self._weather_entity: str | None = data.get(CONF_WEATHER_ENTITY)
+        self._outside_temp_sensor: str | None = data.get(CONF_OUTSIDE_TEMP_SENSOR)
+        self._actuator_switch: str | None = data.get(CONF_ACTUATOR_SWITCH)
+        self._min_cycle_duration: int = data.get(CONF_MIN_CYCLE_DURATION, DEFAULT_MIN_CYCLE_DURATION)
+
+        # Interval of the fallback poll, see _async_schedule_next_poll
+        self.scan_interval = timedelta(
+            seconds=self.entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+
+        # remote.send_command payloads never change at runtime, so build them once
+        self._ir_service_data: dict[str, dict[str, Any]] = {}
+        if self._remote_entity:
+            for command in (self._cmd_on, self._cmd_off, self._cmd_up, self._cmd_down):
+                if command:
+                    self._ir_service_data[command] = self._build_ir_service_data(command)
+
+    def _build_ir_service_data(self, command: str) -> dict[str, Any]:
+        """Build the remote.send_command service data for a command."""
+        service_data: dict[str, Any] = {
+            "entity_id": self._remote_entity,
+            "command": command,
+        }
+
+        # Add device parameter if configured (needed for Broadlink remotes)
+        if self._remote_device:
+            service_data["device"] = self._remote_device
+
+        return service_data
+
+    async def async_config_entry_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Reload the cached configuration when the config entry changes."""
+        self._load_config()
+        if self.update_interval is not None:
+            # Reschedule the pending poll with the (possibly changed) scan interval
+            self._async_schedule_next_poll()
+            self.async_set_updated_data(self.data)
+
     async def async_set_schedule_attributes(self, entity_id: str, attributes: dict[str, Any]) -> None:
         """Set the schedule attributes."""
-        self._schedule_attributes[entity_id] = attributes
-        await self.async_request_refresh()
+        # Only the configured schedule entity is ever read back
+        if entity_id != self._schedule_entity:
+            return
+        self._schedule_attributes = attributes
+        # The attributes are not part of the data dict, so notify listeners explicitly
+        self.async_update_listeners()
+        # Re-evaluate the schedule in the background instead of blocking the service call
+        self._async_start_control()
 
     def record_turn_on_source(self, source: str) -> None:
         """Record how the heat pump was turned on for diagnostic purposes."""
         self._last_turn_on_source = source
-        if source in ["schedule", "climate", "fix", "manual"]:
+        if source in _TIMED_TURN_ON_SOURCES:
             self._last_turn_on_time = dt_util.utcnow()
 
-    def should_auto_turn_off_schedule(self, schedule_entity_id: str) -> bool:
+    def should_auto_turn_off_schedule(self, schedule_state: State, now: datetime) -> bool:
         """Check if heat pump should auto-turn-off when schedule ends."""
         # Don't auto-turn-off if it wasn't turned on by schedule
         if self._last_turn_on_source != "schedule":
             return False
 
-        # Check if there's a keep_on flag in the schedule attributes
-        schedule_attributes = self._schedule_attributes.get(schedule_entity_id, {})
-        schedule_entity = self.hass.states.get(schedule_entity_id)
-        if schedule_entity:
-            entity_attributes = dict(schedule_entity.attributes)
-            entity_attributes.pop("schedule", None)
-            entity_attributes.pop("friendly_name", None)
-            entity_attributes.pop("icon", None)
-            schedule_attributes.update(entity_attributes)
-
-        keep_on = schedule_attributes.get("keep_on", False)
+        # Check if there's a keep_on flag in the schedule attributes; the entity's own attributes win
+        keep_on = schedule_state.attributes.get("keep_on", self._schedule_attributes.get("keep_on", False))
         if keep_on:
             return False
 
         # Check if there's another active schedule entry that would "roll into"
-        return not self._has_upcoming_schedule_entry(schedule_entity_id)
+        return not self._has_upcoming_schedule_entry(schedule_state, now)
 
-    def _has_upcoming_schedule_entry(self, schedule_entity_id: str) -> bool:
+    def _has_upcoming_schedule_entry(self, schedule_state: State, now: datetime) -> bool:
         """Check if there's another schedule entry that starts within the next 30 minutes."""
-        schedule_entity = self.hass.states.get(schedule_entity_id)
-        if not schedule_entity:
-            return False
-
-        schedule_data = schedule_entity.attributes.get("schedule", {})
+        schedule_data = schedule_state.attributes.get("schedule", {})
         if not schedule_data:
             return False
 
-        now = dt_util.now()
         next_30_min = now + timedelta(minutes=30)
 
         for schedule_entry in schedule_data.get("schedule", []):
@@ -134,8 +305,8 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 continue
 
             # Check if this schedule entry would be active in the next 30 minutes
-            entry_start_today = self._time_to_datetime(from_time)
-            entry_end_today = self._time_to_datetime(to_time)
+            entry_start_today = self._time_to_datetime(from_time, now)
+            entry_end_today = self._time_to_datetime(to_time, now)
 
             # Handle overnight schedules
             if entry_end_today < entry_start_today:
@@ -151,26 +322,68 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return False
 
-    def _time_to_datetime(self, time_str: str) -> datetime:
-        """Convert time string (HH:MM) to datetime for today."""
+    def _time_to_datetime(self, time_str: str, now: datetime) -> datetime:
+        """Convert time string (HH:MM) to datetime on the same day as now."""
         try:
             hours, minutes = map(int, time_str.split(":"))
-            now = dt_util.now()
             return now.replace(hour=hours, minute=minutes, second=0, microsecond=0)
         except (ValueError, AttributeError):
-            return dt_util.now()
+            return now
 
     @property
-    def config(self) -> dict[str, Any]:
-        """Return the configuration."""
-        return self.entry.data
+    def schedule_attributes(self) -> dict[str, Any]:
+        """Return the schedule attributes from the service call and the schedule entity."""
+        schedule_entity = self._schedule_entity
+        if not schedule_entity:
+            return {}
+
+        attributes = dict(self._schedule_attributes)
+        schedule_state = self._source_states[schedule_entity]
+        if schedule_state:
+            attributes.update(
+                (key, value)
+                for key, value in schedule_state.attributes.items()
+                if key not in _SCHEDULE_EXCLUDED_ATTRIBUTES
+            )
+        return attributes
 
     @property
     def has_temp_control(self) -> bool:
         """Return whether temperature control commands are configured."""
-        return bool(
-            self.entry.data.get(CONF_TEMP_UP_COMMAND) and self.entry.data.get(CONF_TEMP_DOWN_COMMAND)
-        )
+        return bool(self._cmd_up and self._cmd_down)
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Apply several state changes, then notify listeners and re-run control once at the end."""
+        if not self._batch_depth:
+            self._batch_changed = False
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed and self.data is not None:
+                self._update_internal_data(self.data)
+                self.async_update_listeners()
+                self._async_start_control()
+
+    def sync_power_state(self, is_on: bool) -> None:
+        """Set the physical heat pump and the climate system to the same state at once."""
+        with self.batch_update():
+            self.physical_heat_pump_on = is_on
+            self.climate_system_on = is_on
+
+    @callback
+    def _async_notify_changed(self) -> None:
+        """Notify listeners of an internal state change and re-run control, deferred while batching."""
+        if self._batch_depth:
+            self._batch_changed = True
+        elif self.data is not None:
+            # Listeners read the coordinator data, so bring its internal fields up to date first
+            self._update_internal_data(self.data)
+            self.async_update_listeners()
+            # React to the new state now instead of waiting for the next sensor change or poll
+            self._async_start_control()
 
     @property
     def climate_system_on(self) -> bool:
@@ -182,8 +395,7 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Set the climate system state."""
         if value != self._climate_system_on:
             self._climate_system_on = value
-            if self.data is not None:
-                self.async_set_updated_data(self.data)
+            self._async_notify_changed()
 
     @property
     def physical_heat_pump_on(self) -> bool:
@@ -196,12 +408,14 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if value != self._physical_heat_pump_on:
             self._physical_heat_pump_on = value
             if value:
-                self._cycle_start_time = dt_util.utcnow()
-                self._last_turn_on_time = dt_util.utcnow()
+                now = dt_util.utcnow()
+                self._cycle_start_time = now
+                self._cycle_end_mono = time.monotonic() + self._min_cycle_duration
+                self._last_turn_on_time = now
             else:
                 self._cycle_start_time = None
-            if self.data is not None:
-                self.async_set_updated_data(self.data)
+                self._cycle_end_mono = None
+            self._async_notify_changed()
 
     @property
     def heat_pump_set_temp(self) -> float | None:
@@ -213,8 +427,7 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Set the physical heat pump's set temperature."""
         if value != self._heat_pump_set_temp:
             self._heat_pump_set_temp = value
-            if self.data is not None:
-                self.async_set_updated_data(self.data)
+            self._async_notify_changed()
 
     @property
     def target_temperature(self) -> float:
@@ -226,106 +439,244 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Set the user's desired target temperature."""
         if value != self._target_temperature:
             self._target_temperature = value
-            if self.data is not None:
-                self.async_set_updated_data(self.data)
+            self._async_notify_changed()
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from sensors."""
-        await self.apply_schedule_control()
-        await self.apply_automatic_control()
-        try:
-            data: dict[str, Any] = {}
-
-            # Get room temperature
-            room_temp_entity = self.config.get(CONF_ROOM_TEMP_SENSOR)
-            if room_temp_entity:
-                room_temp_state: State | None = self.hass.states.get(room_temp_entity)
-                if room_temp_state and room_temp_state.state not in ("unknown", "unavailable"):
-                    try:
-                        data["room_temperature"] = float(room_temp_state.state)
-                    except (ValueError, TypeError):
-                        data["room_temperature"] = None
-                else:
-                    data["room_temperature"] = None
-
-            # Get outside temperature data (from weather entity or temperature sensor)
-            outside_temp: float | None = None
-
-            # Try weather entity first
-            weather_entity = self.config.get(CONF_WEATHER_ENTITY)
-            if weather_entity:
-                weather_state: State | None = self.hass.states.get(weather_entity)
-                if weather_state and weather_state.attributes.get("temperature"):
-                    outside_temp = weather_state.attributes["temperature"]
-
-            # If no weather entity or no temperature from weather, try temperature sensor
-            if outside_temp is None:
-                outside_temp_sensor = self.config.get(CONF_OUTSIDE_TEMP_SENSOR)
-                if outside_temp_sensor:
-                    temp_state: State | None = self.hass.states.get(outside_temp_sensor)
-                    if temp_state and temp_state.state not in ("unknown", "unavailable"):
-                        try:
-                            outside_temp = float(temp_state.state)
-                        except (ValueError, TypeError):
-                            outside_temp = None
-
-            data["outside_temperature"] = outside_temp
-
-            # Calculate estimated power consumption
-            data["estimated_power"] = self._calculate_power_consumption(data)
-
-            # Add internal state
-            data["climate_system_on"] = self._climate_system_on
-            data["physical_heat_pump_on"] = self._physical_heat_pump_on
-            if self.has_temp_control:
-                data["heat_pump_set_temp"] = self._heat_pump_set_temp
-            data["target_temperature"] = self._target_temperature
-            data["cycle_start_time"] = self._cycle_start_time
-            data["pending_power_off"] = self._pending_power_off
-
-            # Add schedule data if a schedule entity is configured
-            schedule_entity = self.config.get(CONF_SCHEDULE_ENTITY)
-            if schedule_entity:
-                schedule_state: State | None = self.hass.states.get(schedule_entity)
-                if schedule_state:
-                    data["schedule_active"] = self._is_schedule_active(schedule_state)
-                    # Get attributes from both sources for display
-                    schedule_entity_attributes = dict(schedule_state.attributes)
-                    schedule_entity_attributes.pop("schedule", None)
-                    schedule_entity_attributes.pop("friendly_name", None)
-                    schedule_entity_attributes.pop("icon", None)
-                    data["schedule_attributes"] = {**self._schedule_attributes.get(schedule_entity, {}), **schedule_entity_attributes}
-                else:
-                    data["schedule_active"] = False
-                    data["schedule_attributes"] = {}
-            else:
-                data["schedule_active"] = False
-                data["schedule_attributes"] = {}
+        """Start the control logic and fetch data from sensors."""
+        # Polls also cover any change missed before the state change subscription was in place
+        self._read_source_states()
+        # Control runs alongside the data publish rather than delaying it
+        self._async_start_control()
+        self._async_schedule_next_poll()
+        return self._build_data_sync()
+
+    async def _async_apply_control(self) -> None:
+        """Run the schedule and automatic control logic."""
+        # Read the source states once and hand them to both control phases
+        source_states = self._source_states
+        schedule_entity = self._schedule_entity
+        room_temp_entity = self._room_temp_sensor
+        room_temp = _state_temperature(source_states[room_temp_entity]) if room_temp_entity else None
+
+        # Without a schedule entity there is no schedule logic to run
+        if schedule_entity:
+            # One local time for the whole schedule phase, so its checks agree with each other
+            await self.apply_schedule_control(source_states[schedule_entity], dt_util.now())
+
+        # Automatic control only applies while the climate system is enabled
+        if self._climate_system_on:
+            await self.apply_automatic_control(room_temp)
+
+    @callback
+    def _async_start_control(self) -> None:
+        """Run the control logic in an eager task, coalescing overlapping requests."""
+        # Control logic can only act when the system is on, an off is pending or a schedule drives it
+        if not (self._climate_system_on or self._pending_power_off or self._schedule_entity):
+            return
 
-            # Add diagnostic information
-            if self._last_turn_on_time:
-                data["last_turn_on_time"] = self._last_turn_on_time.isoformat()
-            else:
-                data["last_turn_on_time"] = None
+        if self._control_task is not None and not self._control_task.done():
+            self._control_requested = True
+            return
 
-            data["last_turn_on_source"] = self._last_turn_on_source
+        self._control_requested = True
+        # A background task of the entry, so it is cancelled when the entry unloads
+        self._control_task = self.entry.async_create_background_task(
+            self.hass, self._async_run_control(), f"{DOMAIN} control", eager_start=True
+        )
 
-            return data
+    async def _async_run_control(self) -> None:
+        """Run the control logic until no new run is requested, then publish the result."""
+        while self._control_requested:
+            self._control_requested = False
+            try:
+                await self._async_apply_control()
+            except Exception:  # pylint: disable=broad-except
+                # A control failure must not stop the data publish or later control runs
+                _LOGGER.exception("Error applying control logic")
+        self._async_publish()
+
+    @callback
+    def _async_publish(self) -> None:
+        """Push freshly built data to listeners if anything changed."""
+        self._async_schedule_next_poll()
+        data = self._build_data_sync()
+        if data is not self.data:
+            self.async_set_updated_data(data)
+
+    @callback
+    def _async_schedule_next_poll(self) -> None:
+        """Place the next poll at the next time-driven change if that comes before the scan interval."""
+        interval = self.scan_interval
+        now_mono = time.monotonic()
+
+        # Pending power-off and automatic control both wait for the minimum cycle and the rate limit
+        # to end, and a schedule slot can start or end without its entity changing state
+        deadlines = (
+            self._cycle_end_mono - now_mono if self._cycle_end_mono is not None else None,
+            self._next_command_mono - now_mono if self._next_command_mono is not None else None,
+            self._seconds_to_schedule_boundary(),
+        )
+        for seconds in deadlines:
+            if seconds is not None:
+                remaining = timedelta(seconds=seconds)
+                if timedelta(0) < remaining < interval:
+                    interval = remaining + timedelta(seconds=1)
+
+        self.update_interval = interval
+
+    def _seconds_to_schedule_boundary(self) -> float | None:
+        """Return the seconds until the next schedule slot starts or ends, if there is a schedule."""
+        schedule_entity = self._schedule_entity
+        schedule_state = self._source_states.get(schedule_entity) if schedule_entity else None
+        if not schedule_state:
+            return None
 
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with sensors: {err}") from err
+        schedule_data = schedule_state.attributes.get("schedule", {})
+        if not schedule_data:
+            return None
+
+        now = dt_util.now()
+        current_minutes = now.hour * 60 + now.minute
+        minutes_to_boundary: int | None = None
+        for from_minutes, to_minutes, weekdays, _ in self._parse_schedule(schedule_data):
+            # A slot is active through its "to" minute, so it ends at the start of the next one
+            boundaries = [from_minutes, to_minutes + 1]
+            if weekdays is not None:
+                # Weekday-limited slots can change at midnight
+                boundaries.append(0)
+            for boundary in boundaries:
+                minutes = (boundary - current_minutes) % 1440
+                if minutes and (minutes_to_boundary is None or minutes < minutes_to_boundary):
+                    minutes_to_boundary = minutes
+
+        if minutes_to_boundary is None:
+            return None
+        return minutes_to_boundary * 60 - now.second - now.microsecond / 1_000_000
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start refreshing once Home Assistant has started, staying out of the startup rush."""
+        return async_at_started(self.hass, self._async_start_refreshing)
+
+    async def _async_start_refreshing(self, hass: HomeAssistant) -> None:
+        """Subscribe to the source entities and run the first refresh."""
+        # Refresh when a source entity changes rather than waiting for the next poll
+        self.entry.async_on_unload(self.async_subscribe_sources())
+        self.update_interval = self.scan_interval
+        await self.async_refresh()
+
+    @callback
+    def async_subscribe_sources(self) -> CALLBACK_TYPE:
+        """Subscribe to state changes of the source entities."""
+        return async_track_state_change_event(
+            self.hass, self._tracked_entities, self._handle_source_change
+        )
+
+    def _read_source_states(self) -> None:
+        """Read the current State of every source entity from the state machine."""
+        states = self.hass.states
+        self._source_states = {
+            entity_id: states.get(entity_id) for entity_id in self._tracked_entities
+        }
+
+    @callback
+    def _handle_source_change(self, event: Event[EventStateChangedData]) -> None:
+        """Publish new readings immediately when a source entity changes."""
+        self._source_states[event.data["entity_id"]] = event.data["new_state"]
+        previous = self.data
+        self._async_publish()
+        # Attribute-only changes (e.g. weather humidity) leave the readings untouched
+        if self.data is not previous:
+            self._async_start_control()
+
+    def _build_data_sync(self) -> dict[str, Any]:
+        """Build the coordinator data from the current source states."""
+        data: dict[str, Any] = {}
+
+        # The subscription keeps the source states current, so no state machine lookups are needed
+        snapshot = self._source_states
+
+        # Get room temperature
+        room_temp_entity = self._room_temp_sensor
+        if room_temp_entity:
+            data["room_temperature"] = _state_temperature(snapshot[room_temp_entity])
+
+        # Get outside temperature data (from weather entity or temperature sensor)
+        outside_temp: float | None = None
+
+        # Try weather entity first
+        weather_entity = self._weather_entity
+        if weather_entity:
+            weather_state = snapshot[weather_entity]
+            if weather_state:
+                # A reading of 0°C is valid, so only a missing attribute falls through
+                outside_temp = weather_state.attributes.get("temperature")
+
+        # If no weather entity or no temperature from weather, try temperature sensor
+        if outside_temp is None:
+            outside_temp_sensor = self._outside_temp_sensor
+            if outside_temp_sensor:
+                outside_temp = _state_temperature(snapshot[outside_temp_sensor])
+
+        data["outside_temperature"] = outside_temp
+
+        # Add internal state and the estimated power consumption
+        self._update_internal_data(data)
+
+        # Add schedule data if a schedule entity is configured
+        schedule_state = snapshot[self._schedule_entity] if self._schedule_entity else None
+        if schedule_state:
+            data["schedule_active"] = self._is_schedule_active(schedule_state, dt_util.now())
+            # Attributes are read on demand via schedule_attributes; only track when they change
+            data["schedule_updated"] = schedule_state.last_updated
+        else:
+            data.update(_NO_SCHEDULE_DATA)
+
+        # Hand back the previous dict when nothing changed so entities skip a state write
+        if data == self.data:
+            return self.data
+
+        return data
+
+    def _update_internal_data(self, data: dict[str, Any]) -> None:
+        """Write the coordinator's own state into a data dict in place."""
+        data["estimated_power"] = self._calculate_power_consumption(data)
+        data["climate_system_on"] = self._climate_system_on
+        data["physical_heat_pump_on"] = self._physical_heat_pump_on
+        if self.has_temp_control:
+            data["heat_pump_set_temp"] = self._heat_pump_set_temp
+        data["target_temperature"] = self._target_temperature
+        data["cycle_start_time"] = self._cycle_start_time
+        data["pending_power_off"] = self._pending_power_off
+
+        # Add diagnostic information
+        if self._last_turn_on_time:
+            data["last_turn_on_time"] = self._last_turn_on_time.isoformat()
+        else:
+            data["last_turn_on_time"] = None
+
+        data["last_turn_on_source"] = self._last_turn_on_source
+        data["in_minimum_cycle"] = self.is_in_minimum_cycle()
 
     def _calculate_power_consumption(self, data: dict[str, Any]) -> float:
         """Calculate estimated power consumption based on COP and conditions."""
         if not self._physical_heat_pump_on:
             return 0.0
 
-        min_power: int = self.config.get(CONF_MIN_POWER_CONSUMPTION, DEFAULT_MIN_POWER_CONSUMPTION)
-        cop: float = self.config.get(CONF_COP_VALUE, DEFAULT_COP_VALUE)
+        min_power = self._min_power
+        cop = self._cop
 
         room_temp: float | None = data.get("room_temperature")
         outside_temp: float | None = data.get("outside_temperature")
-        target_temp: float = self._heat_pump_set_temp
+        # Without temperature control the device set point is unknown, so use the target
+        target_temp: float = (
+            self._heat_pump_set_temp if self._heat_pump_set_temp is not None else self._target_temperature
+        )
+
+        # Consecutive updates usually see identical inputs
+        key = (room_temp, outside_temp, target_temp)
+        if self._power_cache is not None and self._power_cache[0] == key:
+            return self._power_cache[1]
 
         # Base power consumption
         estimated_power: float = float(min_power)
@@ -342,30 +693,32 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             estimated_power = float(min_power) * load_factor / (cop * efficiency_factor)
 
-        return round(estimated_power, 1)
+        estimated_power = round(estimated_power, 1)
+        self._power_cache = (key, estimated_power)
+        return estimated_power
 
     async def turn_on_device(self) -> bool:
         """Turn on the physical device (via actuator switch or IR command)."""
-        actuator_switch = self.config.get(CONF_ACTUATOR_SWITCH)
+        actuator_switch = self._actuator_switch
 
         if actuator_switch:
             # Control via actuator switch
             try:
-                await self.hass.services.async_call(
-                    "switch",
-                    "turn_on",
-                    {"entity_id": actuator_switch},
-                    blocking=True,
-                )
-                self._last_command_time = dt_util.utcnow()
+                with self._sending_command():
+                    await self.hass.services.async_call(
+                        "switch",
+                        "turn_on",
+                        {"entity_id": actuator_switch},
+                        blocking=True,
+                    )
+                self._record_command()
                 return True
             except Exception as err:
                 _LOGGER.error("Failed to turn on actuator switch %s: %s", actuator_switch, err)
                 return False
         else:
             # Control via IR command
-            command = self.config.get(CONF_POWER_ON_COMMAND)
-            return await self.send_ir_command(command)
+            return await self.send_ir_command(self._cmd_on)
 
     async def turn_on_device_with_source(self, source: str) -> bool:
         """Turn on the physical device and record the source."""
@@ -374,57 +727,47 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def turn_off_device(self) -> bool:
         """Turn off the physical device (via actuator switch or IR command)."""
-        actuator_switch = self.config.get(CONF_ACTUATOR_SWITCH)
+        actuator_switch = self._actuator_switch
 
         if actuator_switch:
             # Control via actuator switch
             try:
-                await self.hass.services.async_call(
-                    "switch",
-                    "turn_off",
-                    {"entity_id": actuator_switch},
-                    blocking=True,
-                )
-                self._last_command_time = dt_util.utcnow()
+                with self._sending_command():
+                    await self.hass.services.async_call(
+                        "switch",
+                        "turn_off",
+                        {"entity_id": actuator_switch},
+                        blocking=True,
+                    )
+                self._record_command()
                 return True
             except Exception as err:
                 _LOGGER.error("Failed to turn off actuator switch %s: %s", actuator_switch, err)
                 return False
         else:
             # Control via IR command
-            command = self.config.get(CONF_POWER_OFF_COMMAND)
-            return await self.send_ir_command(command)
+            return await self.send_ir_command(self._cmd_off)
 
-    async def send_ir_command(self, command: str | None) -> bool:
-        """Send IR command via Home Assistant service call."""
+    async def send_ir_command(self, command: str | None, repeat: int = 1) -> bool:
+        """Send IR command via Home Assistant service call, repeated `repeat` times."""
         try:
             if not command:
                 _LOGGER.warning("No command configured")
                 return False
 
-            remote_entity = self.config.get(CONF_REMOTE_ENTITY)
-            if not remote_entity:
+            if not self._remote_entity:
                 _LOGGER.error("No remote entity configured")
                 return False
 
-            # Build service data
-            service_data: dict[str, Any] = {
-                "entity_id": remote_entity,
-                "command": command,
-            }
-
-            # Add device parameter if configured (needed for Broadlink remotes)
-            remote_device = self.config.get(CONF_REMOTE_DEVICE)
-            if remote_device:
-                service_data["device"] = remote_device
+            service_data = self._ir_service_data.get(command) or self._build_ir_service_data(command)
+            if repeat > 1:
+                # Let the remote emit all frames from a single service call
+                service_data = {**service_data, "num_repeats": repeat}
 
-            _LOGGER.debug("Sending IR command '%s' to remote entity '%s' (device: %s)", command, remote_entity, remote_device if remote_device else "None")
-            await self.hass.services.async_call(
-                "remote",
-                "send_command",
-                service_data,
-            )
-            self._last_command_time = dt_util.utcnow()
+            _LOGGER.debug("Sending IR command '%s' to remote entity '%s' (device: %s)", command, self._remote_entity, self._remote_device)
+            with self._sending_command():
+                await self._async_send_command(service_data)
+            self._record_command()
             _LOGGER.debug("IR command sent successfully")
             return True
 
@@ -432,24 +775,46 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Failed to send IR command %s: %s", command, err)
             return False
 
+    @contextmanager
+    def _sending_command(self) -> Iterator[None]:
+        """Mark a device command as in flight, which blocks further commands until it completes."""
+        self._commands_in_flight += 1
+        try:
+            yield
+        finally:
+            self._commands_in_flight -= 1
+
+    def _record_command(self) -> None:
+        """Record that a command was just sent to the device."""
+        self._last_command_time = dt_util.utcnow()
+        self._next_command_mono = time.monotonic() + MIN_COMMAND_INTERVAL
+
     def can_change_state(self) -> bool:
-        """Check if enough time has passed since last command."""
-        if self._last_command_time is None:
+        """Check if no command is in flight and enough time has passed since the last one."""
+        # The rate limit is only stamped once a send completes, so also wait for one in flight
+        if self._commands_in_flight:
+            return False
+
+        if self._next_command_mono is None:
             return True
 
-        min_interval: timedelta = timedelta(seconds=5)  # Minimum 5 seconds between commands
-        return dt_util.utcnow() - self._last_command_time > min_interval
+        return time.monotonic() > self._next_command_mono
 
     def is_in_minimum_cycle(self) -> bool:
         """Check if we're still in minimum cycle duration."""
-        if not self._cycle_start_time:
+        if self._cycle_end_mono is None:
             return False
 
-        min_cycle: int = self.config.get(CONF_MIN_CYCLE_DURATION, 300)
-        elapsed: float = (dt_util.utcnow() - self._cycle_start_time).total_seconds()
-        return elapsed < min_cycle
+        return time.monotonic() < self._cycle_end_mono
+
+    def _minimum_cycle_remaining(self) -> float:
+        """Return the seconds left in the current minimum cycle."""
+        if self._cycle_end_mono is None:
+            return 0.0
 
-    async def apply_schedule_control(self) -> None:
+        return self._cycle_end_mono - time.monotonic()
+
+    async def apply_schedule_control(self, schedule_state: State | None, now: datetime) -> None:
         """Apply schedule-based control to the heat pump."""
         # First, check if we have a pending power-off action waiting for minimum cycle to complete
         if self._pending_power_off and self._physical_heat_pump_on:
@@ -466,25 +831,19 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         _LOGGER.error("Failed to execute pending power OFF")
                 else:
                     _LOGGER.debug("Cannot execute pending power OFF yet (rate limited)")
-            else:
-                # Still in minimum cycle, calculate remaining time
-                min_cycle: int = self.config.get(CONF_MIN_CYCLE_DURATION, 300)
-                elapsed: float = (dt_util.utcnow() - self._cycle_start_time).total_seconds() if self._cycle_start_time else 0
-                remaining: float = min_cycle - elapsed
-                _LOGGER.debug("Pending power OFF waiting for minimum cycle (%.0f seconds remaining)", remaining)
-
-        schedule_entity_id = self.config.get(CONF_SCHEDULE_ENTITY)
-        if not schedule_entity_id:
-            _LOGGER.debug("No schedule entity configured, skipping schedule control")
-            return
+            elif _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Pending power OFF waiting for minimum cycle (%.0f seconds remaining)",
+                    self._minimum_cycle_remaining(),
+                )
 
-        schedule_state = self.hass.states.get(schedule_entity_id)
         if not schedule_state:
-            _LOGGER.debug("Schedule entity %s not found", schedule_entity_id)
+            _LOGGER.debug("Schedule entity %s not found", self._schedule_entity)
             return
 
-        # Check if schedule is currently active based on its schedule data
-        schedule_active = self._is_schedule_active(schedule_state)
+        # Find the active schedule entry once; the schedule is active when there is one
+        active_entry = self._get_active_schedule_entry(schedule_state, now)
+        schedule_active = active_entry is not None
         _LOGGER.debug("Schedule active: %s", schedule_active)
 
         # If schedule is not active, check if we should turn off (schedule ended)
@@ -494,16 +853,13 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.info("Schedule not active, clearing pending power OFF action")
                 self._pending_power_off = False
 
-            if self.should_auto_turn_off_schedule(schedule_entity_id):
+            if self.should_auto_turn_off_schedule(schedule_state, now):
                 _LOGGER.info("Schedule ended, turning off heat pump (not rolling into another entry)")
                 if self.is_in_minimum_cycle():
-                    min_cycle: int = self.config.get(CONF_MIN_CYCLE_DURATION, 300)
-                    elapsed: float = (dt_util.utcnow() - self._cycle_start_time).total_seconds() if self._cycle_start_time else 0
-                    remaining: float = min_cycle - elapsed
                     _LOGGER.warning(
                         "Cannot turn off heat pump during minimum cycle duration. "
                         "Scheduling power OFF for when cycle completes (%.0f seconds remaining)",
-                        remaining
+                        self._minimum_cycle_remaining()
                     )
                     self._pending_power_off = True
                 elif self.can_change_state():
@@ -515,32 +871,26 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         # If schedule is active, apply attributes from the active slot
-        if schedule_active:
+        if active_entry is not None:
             _LOGGER.debug("Schedule is active, applying schedule control")
 
-            # Get the currently active schedule entry
-            active_entry = self._get_active_schedule_entry(schedule_state)
-            if not active_entry:
-                _LOGGER.debug("No active schedule entry found")
-                return
-
-            # Get attributes from the active schedule slot
-            attributes = {}
-
             # Copy attributes from the active slot, excluding time/weekday info
-            for key, value in active_entry.items():
-                if key not in ["from", "to", "weekdays"]:
-                    attributes[key] = value
+            attributes = {
+                key: value
+                for key, value in active_entry.items()
+                if key not in _SCHEDULE_SLOT_TIME_KEYS
+            }
 
             _LOGGER.debug("Active slot attributes: %s", attributes)
 
             # Check run_if condition
             run_if_template = attributes.get("run_if")
             if run_if_template:
+                template = self._get_template(run_if_template)
+                if template is None:
+                    return
                 try:
-                    from homeassistant.helpers.template import Template
-                    template = Template(run_if_template, self.hass)
-                    result = await template.async_render()
+                    result = template.async_render()
                     _LOGGER.debug("run_if template evaluated to: %s", result)
                     if not result:
                         _LOGGER.debug("run_if condition not met, skipping schedule control")
@@ -552,21 +902,43 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Apply all matching attributes
             await self._apply_schedule_attributes(attributes)
 
-    def _is_schedule_active(self, schedule_state: State) -> bool:
+    def _is_schedule_active(self, schedule_state: State, now: datetime) -> bool:
         """Check if the schedule entity is currently active based on its schedule data."""
-        return self._get_active_schedule_entry(schedule_state) is not None
+        return self._get_active_schedule_entry(schedule_state, now) is not None
 
-    def _get_active_schedule_entry(self, schedule_state: State) -> dict[str, Any] | None:
+    def _get_active_schedule_entry(self, schedule_state: State, now: datetime) -> dict[str, Any] | None:
         """Get the currently active schedule entry, or None if no entry is active."""
         # Check if schedule entity has schedule information
         schedule_data = schedule_state.attributes.get("schedule", {})
         if not schedule_data:
             return None
 
-        # Get current time
-        now = dt_util.now()
+        # Get the current time of day once for every entry
+        current_minutes = now.hour * 60 + now.minute
+        current_weekday = now.weekday()  # 0 = Monday, 6 = Sunday
 
         # Check each schedule entry
+        for from_minutes, to_minutes, weekdays, schedule_entry in self._parse_schedule(schedule_data):
+            # Handle overnight schedules (when to_time is next day)
+            if to_minutes < from_minutes:
+                active = current_minutes >= from_minutes or current_minutes <= to_minutes
+            else:
+                active = from_minutes <= current_minutes <= to_minutes
+
+            # Check weekdays if specified
+            if active and (weekdays is None or current_weekday in weekdays):
+                return schedule_entry
+
+        return None
+
+    def _parse_schedule(self, schedule_data: dict[str, Any]) -> tuple[_ParsedScheduleEntry, ...]:
+        """Return the schedule entries with parsed times, reparsing only when the schedule changes."""
+        # Home Assistant keeps the same attribute objects while a state's attributes are unchanged
+        cached = self._parsed_schedule
+        if cached is not None and cached[0] is schedule_data:
+            return cached[1]
+
+        entries: list[_ParsedScheduleEntry] = []
         for schedule_entry in schedule_data.get("schedule", []):
             # Parse the schedule entry
             from_time = schedule_entry.get("from")
@@ -576,36 +948,25 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if not from_time or not to_time:
                 continue
 
-            # Convert times to minutes since midnight for easier comparison
-            from_minutes = self._time_to_minutes(from_time)
-            to_minutes = self._time_to_minutes(to_time)
-            current_minutes = now.hour * 60 + now.minute
-
-            # Handle overnight schedules (when to_time is next day)
-            if to_minutes < from_minutes:
-                if current_minutes >= from_minutes or current_minutes <= to_minutes:
-                    active = True
-                else:
-                    active = False
-            else:
-                if from_minutes <= current_minutes <= to_minutes:
-                    active = True
-                else:
-                    active = False
-
-            # Check weekdays if specified
-            if weekdays and active:
-                current_weekday = now.weekday()  # 0 = Monday, 6 = Sunday
+            python_weekdays: frozenset[int] | None = None
+            if weekdays:
                 # Convert HA weekdays to Python weekdays (HA: 1=Monday, 7=Sunday)
                 ha_weekdays = weekdays if isinstance(weekdays, list) else [weekdays]
-                python_weekdays = [(wd - 1) % 7 for wd in ha_weekdays]  # Convert to 0-6
-                if current_weekday not in python_weekdays:
-                    active = False
+                python_weekdays = frozenset((wd - 1) % 7 for wd in ha_weekdays)  # Convert to 0-6
 
-            if active:
-                return schedule_entry
+            # Convert times to minutes since midnight for easier comparison
+            entries.append(
+                (
+                    self._time_to_minutes(from_time),
+                    self._time_to_minutes(to_time),
+                    python_weekdays,
+                    schedule_entry,
+                )
+            )
 
-        return None
+        parsed = tuple(entries)
+        self._parsed_schedule = (schedule_data, parsed)
+        return parsed
 
     def _time_to_minutes(self, time_str: str) -> int:
         """Convert time string (HH:MM) to minutes since midnight."""
@@ -616,17 +977,34 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Invalid time format: %s", time_str)
             return 0
 
-    async def _render_template_value(self, value: Any) -> Any:
+    def _get_template(self, source: str) -> Template | None:
+        """Return the parsed template for a source string, or None if it is invalid."""
+        if source in self._templates:
+            return self._templates[source]
+
+        template: Template | None = Template(source, self.hass)
+        try:
+            # Compile up front so a syntax error is only reported once
+            template.ensure_valid()
+        except TemplateError as err:
+            _LOGGER.error("Invalid template '%s': %s", source, err)
+            template = None
+        self._templates[source] = template
+        return template
+
+    def _render_template_value(self, value: Any) -> Any:
         """Render a value if it's a template string, otherwise return as-is."""
         if not isinstance(value, str):
             return value
 
         # Check if the value looks like a template
         if "{{" in value or "{%" in value:
+            template = self._get_template(value)
+            if template is None:
+                return value
             try:
-                from homeassistant.helpers.template import Template
-                template = Template(value, self.hass)
-                result = await template.async_render()
+                # async_render is a callback, it renders synchronously
+                result = template.async_render()
                 _LOGGER.debug("Rendered template '%s' to '%s'", value, result)
                 return result
             except Exception as err:
@@ -643,7 +1021,7 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         set_temperature_raw = attributes.get("set_temperature")
         set_temperature = None
         if set_temperature_raw is not None:
-            rendered = await self._render_template_value(set_temperature_raw)
+            rendered = self._render_template_value(set_temperature_raw)
             try:
                 set_temperature = float(rendered)
             except (ValueError, TypeError):
@@ -656,18 +1034,16 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.debug("Current set temp: %.1f°C, Diff: %.1f°C", current_temp, temp_diff)
             if abs(temp_diff) >= 0.5:  # Only change if difference is significant
                 steps = int(abs(temp_diff))
-                command = (
-                    self.config.get(CONF_TEMP_UP_COMMAND)
-                    if temp_diff > 0
-                    else self.config.get(CONF_TEMP_DOWN_COMMAND)
-                )
+                command = self._cmd_up if temp_diff > 0 else self._cmd_down
 
                 if command and self.can_change_state():
                     _LOGGER.info("Adjusting device set temperature by %s steps to reach %.1f°C", steps, set_temperature)
-                    for _ in range(steps):
-                        await self.send_ir_command(command)
-                    self.heat_pump_set_temp = set_temperature
-                    _LOGGER.info("Schedule set device temperature: %.1f°C", set_temperature)
+                    # Every step is the same command, so the remote repeats it from one service call
+                    # A sub-degree difference has no step to send but still records the new set point
+                    if not steps or await self.send_ir_command(command, repeat=steps):
+                        # Like the other schedule fields, published once when the control run ends
+                        self._heat_pump_set_temp = set_temperature
+                        _LOGGER.info("Schedule set device temperature: %.1f°C", set_temperature)
                 else:
                     if not command:
                         _LOGGER.warning("No temperature command configured")
@@ -708,7 +1084,7 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Apply target temperature if specified
         target_temp_raw = attributes.get("target_temperature")
         if target_temp_raw is not None:
-            rendered = await self._render_template_value(target_temp_raw)
+            rendered = self._render_template_value(target_temp_raw)
             try:
                 target_temp = float(rendered)
                 if target_temp != self._target_temperature:
@@ -722,33 +1098,20 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         preset_mode = attributes.get("preset_mode")
         if preset_mode:
             _LOGGER.debug("Schedule requesting preset_mode: %s", preset_mode)
-            try:
-                from homeassistant.components.climate import ClimatePresetMode
-
-                # Define preset temperatures (same as in climate entity)
-                preset_temperatures = {
-                    ClimatePresetMode.HOME: 21.0,
-                    ClimatePresetMode.AWAY: 16.0,
-                    ClimatePresetMode.SLEEP: 18.0,
-                    ClimatePresetMode.COMFORT: 22.0,
-                }
-
-                if preset_mode in preset_temperatures:
-                    preset_temp = preset_temperatures[preset_mode]
-                    if preset_temp != self._target_temperature:
-                        self._target_temperature = preset_temp
-                        _LOGGER.info("Schedule set preset mode %s with temperature %.1f°C", preset_mode, preset_temp)
-                    else:
-                        _LOGGER.debug("Preset temperature already set to %.1f°C", preset_temp)
-                else:
-                    _LOGGER.warning("Unknown preset mode: %s", preset_mode)
-            except ImportError:
-                _LOGGER.error("ClimatePresetMode not available")
+            preset_temp = _SCHEDULE_PRESET_TEMPERATURES.get(preset_mode)
+            if preset_temp is None:
+                _LOGGER.warning("Unknown preset mode: %s", preset_mode)
+            elif preset_temp != self._target_temperature:
+                self._target_temperature = preset_temp
+                _LOGGER.info("Schedule set preset mode %s with temperature %.1f°C", preset_mode, preset_temp)
+            else:
+                _LOGGER.debug("Preset temperature already set to %.1f°C", preset_temp)
 
-    async def apply_automatic_control(self) -> None:
+    async def apply_automatic_control(self, room_temp: float | None) -> None:
         """Automatically control physical heat pump based on temperature when climate is on."""
-        # Only apply automatic control if climate system is enabled
-        if not self._climate_system_on:
+        # Nothing to do if the last evaluation of these exact inputs needed no command
+        inputs = (room_temp, self._target_temperature, self._physical_heat_pump_on)
+        if inputs == self._idle_control_inputs:
             return
 
         # Can't control if we're in minimum cycle period
@@ -759,18 +1122,8 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not self.can_change_state():
             return
 
-        # Get current room temperature
-        room_temp_entity = self.config.get(CONF_ROOM_TEMP_SENSOR)
-        if not room_temp_entity:
-            return
-
-        room_temp_state: State | None = self.hass.states.get(room_temp_entity)
-        if not room_temp_state or room_temp_state.state in ("unknown", "unavailable"):
-            return
-
-        try:
-            room_temp = float(room_temp_state.state)
-        except (ValueError, TypeError):
+        # Without a room temperature reading there is nothing to compare against
+        if room_temp is None:
             return
 
         # Compare room temperature against target temperature (user's desired temp)
@@ -799,3 +1152,7 @@ class SmartHeatPumpCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     room_temp,
                     target_temp
                 )
+
+        # Within the hysteresis band, so remember the inputs until one of them changes
+        else:
+            self._idle_control_inputs = inputs
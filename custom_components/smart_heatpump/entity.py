@@ -0,0 +1,26 @@
+"""Base entity for Smarter Heat Pump."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import SmartHeatPumpCoordinator
+
+
+class SmartHeatPumpEntity(CoordinatorEntity):
+    """Common base for all Smarter Heat Pump entities."""
+
+    _attr_has_entity_name = True
+    # Appended to the config entry ID to form the unique ID
+    _unique_id_suffix: str
+
+    def __init__(
+        self,
+        coordinator: SmartHeatPumpCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._config_entry = config_entry
+        self._attr_unique_id = f"{config_entry.entry_id}_{self._unique_id_suffix}"
+        self._attr_device_info = coordinator.device_info
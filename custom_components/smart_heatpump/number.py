@@ -8,7 +8,6 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -20,6 +19,7 @@ from .const import (
     DEFAULT_MAX_TEMP,
 )
 from .coordinator import SmartHeatPumpCoordinator
+from .entity import SmartHeatPumpEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,10 +41,10 @@ async def async_setup_entry(
         async_add_entities([SmartHeatPumpTargetTempNumber(coordinator, config_entry)])
 
 
-class SmartHeatPumpTargetTempNumber(CoordinatorEntity, NumberEntity):
+class SmartHeatPumpTargetTempNumber(SmartHeatPumpEntity, NumberEntity):
     """Number entity to control heat pump set temperature via IR commands."""
 
-    _attr_has_entity_name = True
+    _unique_id_suffix = "target_temp_number"
     _attr_name = "Set Temperature"
     _attr_mode = NumberMode.BOX
     _attr_native_step = 1.0
@@ -56,21 +56,12 @@ class SmartHeatPumpTargetTempNumber(CoordinatorEntity, NumberEntity):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_target_temp_number"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Smarter Heat Pump"),
-            "manufacturer": "Smarter Heat Pump Integration",
-            "model": "Smarter Heat Pump",
-        }
-        self._attr_native_min_value = self._config_entry.data.get(
-            CONF_MIN_TEMP, DEFAULT_MIN_TEMP
-        )
-        self._attr_native_max_value = self._config_entry.data.get(
-            CONF_MAX_TEMP, DEFAULT_MAX_TEMP
-        )
+        super().__init__(coordinator, config_entry)
+        data = config_entry.data
+        self._attr_native_min_value = data.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
+        self._attr_native_max_value = data.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
+        self._cmd_up: str | None = data.get(CONF_TEMP_UP_COMMAND)
+        self._cmd_down: str | None = data.get(CONF_TEMP_DOWN_COMMAND)
 
     @property
     def native_value(self) -> float | None:
@@ -91,30 +82,29 @@ class SmartHeatPumpTargetTempNumber(CoordinatorEntity, NumberEntity):
             )
             return
 
-        if not self.coordinator.can_change_state():
-            _LOGGER.warning("Cannot change temperature: state change not allowed")
-            return
-
         current_temp = self.coordinator.heat_pump_set_temp
         temp_diff = value - current_temp
 
         if abs(temp_diff) < 0.5:
             return
 
+        # Less than a whole degree has no step to send, but the new set point is still recorded
         steps = int(abs(temp_diff))
-        command = (
-            self._config_entry.data.get(CONF_TEMP_UP_COMMAND)
-            if temp_diff > 0
-            else self._config_entry.data.get(CONF_TEMP_DOWN_COMMAND)
-        )
+        if steps == 0:
+            self.coordinator.heat_pump_set_temp = value
+            return
+
+        if not self.coordinator.can_change_state():
+            _LOGGER.warning("Cannot change temperature: state change not allowed")
+            return
+
+        command = self._cmd_up if temp_diff > 0 else self._cmd_down
 
         if command:
-            for _ in range(steps):
-                success = await self.coordinator.send_ir_command(command)
-                if not success:
-                    _LOGGER.error("Failed to send IR command")
-                    break
+            success = await self.coordinator.send_ir_command(command, repeat=steps)
+            if not success:
+                _LOGGER.error("Failed to send IR command")
 
             # Update the coordinator's tracked physical heat pump temperature
+            # (the setter notifies listeners, including this entity, if it changed)
             self.coordinator.heat_pump_set_temp = value
-            self.async_write_ha_state()
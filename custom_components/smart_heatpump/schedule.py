@@ -9,10 +9,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import SmartHeatPumpCoordinator
+from .entity import SmartHeatPumpEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,30 +26,14 @@ async def async_setup_entry(
     async_add_entities([SmartHeatPumpSchedule(coordinator, config_entry)])
 
 
-class SmartHeatPumpSchedule(CoordinatorEntity, SensorEntity):
+class SmartHeatPumpSchedule(SmartHeatPumpEntity, SensorEntity):
     """Smarter Heat Pump schedule entity."""
 
-    _attr_has_entity_name = True
+    _unique_id_suffix = "schedule"
     _attr_name = "Schedule Status"
     _attr_icon = "mdi:calendar-clock"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(
-        self,
-        coordinator: SmartHeatPumpCoordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the schedule entity."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_schedule"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Smarter Heat Pump"),
-            "manufacturer": "Smarter Heat Pump Integration",
-            "model": "Smarter Heat Pump",
-        }
-
     @property
     def native_value(self) -> str:
         """Return the schedule status."""
@@ -66,10 +49,9 @@ class SmartHeatPumpSchedule(CoordinatorEntity, SensorEntity):
         if self.coordinator.data is None:
             return {}
 
-        schedule_attributes = self.coordinator.data.get("schedule_attributes", {})
+        attrs = self.coordinator.schedule_attributes
 
         # Add diagnostic information
-        attrs = dict(schedule_attributes)
         if self.coordinator.data.get("last_turn_on_time"):
             attrs["last_turn_on_time"] = self.coordinator.data.get("last_turn_on_time")
         if self.coordinator.data.get("last_turn_on_source"):
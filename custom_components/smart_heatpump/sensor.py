@@ -13,7 +13,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, UnitOfPower
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -22,6 +21,7 @@ from .const import (
     DEFAULT_COP_VALUE,
 )
 from .coordinator import SmartHeatPumpCoordinator
+from .entity import SmartHeatPumpEntity
 from .schedule import SmartHeatPumpSchedule
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,10 +47,10 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class SmartHeatPumpPowerSensor(CoordinatorEntity, SensorEntity):
+class SmartHeatPumpPowerSensor(SmartHeatPumpEntity, SensorEntity):
     """Power consumption sensor for Smarter Heat Pump."""
 
-    _attr_has_entity_name = True
+    _unique_id_suffix = "power"
     _attr_name = "Estimated Power Consumption"
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -63,15 +63,9 @@ class SmartHeatPumpPowerSensor(CoordinatorEntity, SensorEntity):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_power"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Smarter Heat Pump"),
-            "manufacturer": "Smarter Heat Pump Integration",
-            "model": "Smarter Heat Pump",
-        }
+        super().__init__(coordinator, config_entry)
+        # Static for the lifetime of the entity
+        self._cop: float = config_entry.data.get(CONF_COP_VALUE, DEFAULT_COP_VALUE)
 
     @property
     def native_value(self) -> float | None:
@@ -84,7 +78,7 @@ class SmartHeatPumpPowerSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
         attrs: dict[str, Any] = {
-            "cop": self._config_entry.data.get(CONF_COP_VALUE, DEFAULT_COP_VALUE),
+            "cop": self._cop,
             "physical_heat_pump_on": self.coordinator.physical_heat_pump_on,
         }
 
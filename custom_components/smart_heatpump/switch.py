@@ -8,13 +8,12 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
     CONF_VIRTUAL_SWITCH,
 )
-from .coordinator import SmartHeatPumpCoordinator
+from .entity import SmartHeatPumpEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,29 +29,13 @@ async def async_setup_entry(
         async_add_entities([SmartHeatPumpSwitch(coordinator, config_entry)])
 
 
-class SmartHeatPumpSwitch(CoordinatorEntity, SwitchEntity):
+class SmartHeatPumpSwitch(SmartHeatPumpEntity, SwitchEntity):
     """Smarter Heat Pump power switch entity."""
 
-    _attr_has_entity_name = True
+    _unique_id_suffix = "power_switch"
     _attr_name = "Power"
     _attr_icon = "mdi:power"
 
-    def __init__(
-        self,
-        coordinator: SmartHeatPumpCoordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the switch entity."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_power_switch"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Smarter Heat Pump"),
-            "manufacturer": "Smarter Heat Pump Integration",
-            "model": "Smarter Heat Pump",
-        }
-
     @property
     def is_on(self) -> bool:
         """Return true if the physical heat pump is on."""
@@ -76,9 +59,8 @@ class SmartHeatPumpSwitch(CoordinatorEntity, SwitchEntity):
         if not self.coordinator.physical_heat_pump_on and self.coordinator.can_change_state():
             success = await self.coordinator.turn_on_device()
             if success:
-                self.coordinator.physical_heat_pump_on = True
                 # Also enable climate system since physical pump is running
-                self.coordinator.climate_system_on = True
+                self.coordinator.sync_power_state(True)
                 _LOGGER.info("Physical heat pump turned on via power switch")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -86,7 +68,6 @@ class SmartHeatPumpSwitch(CoordinatorEntity, SwitchEntity):
         if self.coordinator.physical_heat_pump_on and self.coordinator.can_change_state():
             success = await self.coordinator.turn_off_device()
             if success:
-                self.coordinator.physical_heat_pump_on = False
                 # Also disable climate system since physical pump is off
-                self.coordinator.climate_system_on = False
+                self.coordinator.sync_power_state(False)
                 _LOGGER.info("Physical heat pump turned off via power switch")
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Tests for the Smart Heat Pump coordinator helpers."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.smart_heatpump.coordinator import _safe_float  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("21.5", 21.5),
+        ("-3", -3.0),
+        ("-.5", -0.5),
+        (".-5", None),
+        ("", None),
+        ("unknown", None),
+        ("unavailable", None),
+        ("1e3", 1000.0),
+    ],
+)
+def test_safe_float(value: str, expected: float | None) -> None:
+    """Test that state strings parse to a float or None."""
+    assert _safe_float(value) == expected